@@ -9,7 +9,7 @@ from qimpy import rc, log, TreeNode, dft, MPI
 from qimpy.profiler import stopwatch
 from qimpy.io import CheckpointPath
 from qimpy.mpi import BufferView, Waitable, globalreduce
-from qimpy.math import eighg, dagger
+from qimpy.math import batched_eigh, dagger
 from . import Wavefunction
 
 
@@ -19,10 +19,15 @@ class Davidson(TreeNode):
     electrons: dft.electrons.Electrons  #: Electronic system to diagonalize
     n_iterations: int  #: Number of diagonalization iterations
     eig_threshold: float  #: Eigenvalue convergence threshold (in :math:`E_h`)
+    mixed_precision: bool  #: Whether to use FP32 subspace eigenproblems far
+    #: from convergence (outer state remains FP64 throughout)
     _line_prefix: str
     _norm_cut: float
     _i_iter: int
     _HC: Wavefunction  #: Used for coordination with sub-classes
+    _ke: Optional[torch.Tensor]  #: Cached basis KE used by `precondition`
+    _ke_Gbasis: Optional[torch.Tensor]  #: `lattice.Gbasis` that `_ke` is valid for
+    _workspace: dict[str, torch.Tensor]  #: Persistent subspace-matrix buffers
 
     def __init__(
         self,
@@ -31,6 +36,7 @@ class Davidson(TreeNode):
         checkpoint_in: CheckpointPath = CheckpointPath(),
         n_iterations: int = 100,
         eig_threshold: float = 1e-8,
+        mixed_precision: Optional[bool] = None,
     ) -> None:
         """Initialize diagonalizer with stopping criteria.
 
@@ -47,16 +53,31 @@ class Davidson(TreeNode):
             falls below this threshold. This only affects fixed-Hamiltonian
             calculations because the self-consistent field method overrides
             this when diagonalizing in an inner loop.
+        mixed_precision
+            :yaml:`Whether to solve subspace eigenproblems in FP32.`
+            The default None enables this only on GPUs, where the subspace
+            solves benefit most. The wavefunctions and Hamiltonian
+            applications always remain in FP64, and the subspace eigenproblem
+            switches back to FP64 once eigenvalues approach convergence.
+            Note that FP32 rotations leave the subspace orthonormal only to
+            single precision, which can limit converged eigenvalues at the
+            ~1e-7 relative level; set False for strict FP64 accuracy.
         """
         super().__init__()
         self.electrons = electrons
         self.n_iterations = n_iterations
         self.eig_threshold = eig_threshold
+        self.mixed_precision = (
+            rc.use_cuda if (mixed_precision is None) else mixed_precision
+        )
         self._line_prefix = "Davidson"
         self._norm_cut = np.sqrt(
             electrons.basis.n_tot * 1e-15  # estimate round-off
         )  # to spot null bands in _regularize
         self._i_iter = 0
+        self._ke = None
+        self._ke_Gbasis = None
+        self._workspace = {}
 
     def __repr__(self) -> str:
         return (
@@ -94,16 +115,27 @@ class Davidson(TreeNode):
         """Inverse-kinetic preconditioner on the Cerr in eigenpairs,
         using the per-band kinetic energy KEref"""
         basis = self.electrons.basis
-        x = basis.get_ke(basis.mine)[None, :, None, None, :] / KEref[..., None, None]
-        x += torch.exp(-x)  # don't modify x ~ 0
-        return Cerr / x
+        if (self._ke is None) or (self._ke_Gbasis is not basis.lattice.Gbasis):
+            self._ke = basis.get_ke(basis.mine)  # invariant between lattice updates
+            self._ke_Gbasis = basis.lattice.Gbasis
+        coeff = _precondition(Cerr.coeff, self._ke, KEref)
+        return Wavefunction(basis, coeff=coeff, band_division=Cerr.band_division)
 
     def _regularize(self, C: Wavefunction, norm: torch.Tensor, i_iter: int) -> None:
         """Regularize low-norm bands of C by randomizing them,
         using seed based on current iteration number i_iter"""
+        # Quick check: most iterations have no low-norm bands at all,
+        # so skip the full-tensor broadcast with a single-bool reduction:
+        any_low = bool((norm < self._norm_cut).any().item())
+        if C.basis.division.n_procs > 1:
+            any_low = C.basis.comm.allreduce(any_low, MPI.LOR)
+        if not any_low:
+            return  # no regularization needed
         # Find low-norm bands:
         if C.basis.division.n_procs > 1:
             # guard against machine-precision differences between procs
+            # (BufferView exposes the device pointer directly, so this Bcast
+            # is in-place on GPU via CUDA-aware MPI with no host round-trip)
             rc.current_stream_synchronize()
             C.basis.comm.Bcast(BufferView(norm))
         low_norm = norm < self._norm_cut
@@ -114,10 +146,22 @@ class Davidson(TreeNode):
         C.randomize_selected(i_spin, i_k, i_band, i_iter)  # seeded by i_iter
         norm[i_spin, i_k, i_band] = 1.0
 
+    def _get_workspace(
+        self, name: str, shape: tuple[int, ...], dtype: torch.dtype
+    ) -> torch.Tensor:
+        """Get persistent workspace tensor `name` with `shape` and `dtype`,
+        reusing any previous allocation whenever possible."""
+        ws = self._workspace.get(name)
+        if (ws is None) or (ws.shape != shape) or (ws.dtype != dtype):
+            ws = torch.empty(shape, dtype=dtype, device=rc.device)
+            self._workspace[name] = ws
+        return ws
+
     def get_Eband(self) -> float:
         """Compute the sum over band eigenvalues, averaged over k"""
         electrons = self.electrons
         n_bands = electrons.fillings.n_bands
+        # (w_sk is the combined spin/k weight precomputed once in Basis)
         return globalreduce.sum(
             electrons.basis.w_sk * electrons.eig[..., :n_bands],
             electrons.kpoints.comm,
@@ -129,14 +173,24 @@ class Davidson(TreeNode):
         """Return maximum change in eigenvalues and how many
         eigenvalues are converged at all spin and k"""
         n_bands = self.electrons.fillings.n_bands
-        deig_max = globalreduce.max(deig[..., :n_bands], self.electrons.comm)
-        pending = torch.where(
-            (deig[..., :n_bands] > eig_threshold).flatten(0, 1).any(dim=0)
-        )[0]
-        n_eigs_done = self.electrons.comm.allreduce(
-            pending[0].item() if len(pending) else n_bands, MPI.MIN
+        deig_sel = deig[..., :n_bands]
+        bad = (deig_sel > eig_threshold).flatten(0, 1).any(dim=0)
+        # First unconverged band, found on-device (argmax yields first True):
+        n_eigs_done_loc = torch.where(
+            bad.any(),
+            bad.to(torch.int8).argmax(),
+            torch.tensor(n_bands, device=deig.device),
         )
-        return deig_max, n_eigs_done
+        if deig_sel.numel():
+            deig_max_loc = deig_sel.max()
+        else:
+            deig_max_loc = torch.tensor(-np.inf, device=deig.device)
+        # Combine MAX(deig) and MIN(n_eigs_done) into a single collective
+        # (as MAX of the negated count), with one host transfer for both:
+        buf = torch.stack((deig_max_loc, -n_eigs_done_loc.to(deig.dtype)))
+        buf_np = buf.to(rc.cpu).numpy()
+        self.electrons.comm.Allreduce(MPI.IN_PLACE, buf_np, MPI.MAX)
+        return buf_np[0], int(-buf_np[1])
 
     def __call__(
         self, n_iterations: Optional[int] = None, eig_threshold: Optional[float] = None
@@ -162,7 +216,7 @@ class Davidson(TreeNode):
                 f" min(n_basis)/2 = {el.basis.n_min//2} in Davidson"
             )
         HC = el.hamiltonian(el.C)
-        el.eig, V = torch.linalg.eigh((el.C ^ HC).wait())  # subspace eigs
+        el.eig, V = batched_eigh((el.C ^ HC).wait())  # subspace eigs
         el.deig_max = np.inf  # don't know eig accuracy yet
         el.C = el.C @ V  # switch to eigen-basis
         HC = HC @ V  # switch to eigen-basis
@@ -170,6 +224,11 @@ class Davidson(TreeNode):
         self._report(inner_loop=inner_loop)
         n_eigs_done = 0
 
+        # Persistent workspace for subspace matrices (reused every iteration):
+        n_spins, nk_mine = el.C.coeff.shape[:2]
+        ws_shape = (n_spins, nk_mine, 2 * n_bands_max, 2 * n_bands_max)
+        ws_HC = self._get_workspace("HC", ws_shape, el.C.coeff.dtype)
+
         for self._i_iter in range(self._i_iter + 1, n_iterations + 1):
             n_bands_cur = el.C.n_bands()
 
@@ -185,6 +244,11 @@ class Davidson(TreeNode):
             self._regularize(Cexp, norm_exp, self._i_iter)
             Cexp *= 1.0 / norm_exp[..., None, None]
             Cexp.constrain()
+            # --- orthonormalize expansion against current subspace and itself,
+            # which makes the subspace eigenproblem below standard instead of
+            # generalized (no overlap tile or Cholesky factorization needed):
+            Cexp -= el.C @ el.C.dot_O(Cexp).wait()
+            Cexp = Cexp.orthonormalize()
             n_bands_exp = Cexp.n_bands()
             n_bands_new = n_bands_cur + n_bands_exp
 
@@ -192,28 +256,34 @@ class Davidson(TreeNode):
             Cnew = el.C.cat(Cexp, clear=True)  # this clears el.C and Cexp memory
             Cexp = Cnew[:, :, n_bands_cur:]  # re-set to a view of the concatenation
 
-            # Expansion subspace overlaps:
-            C_OC = torch.eye(n_bands_cur, device=V.device)[None, None]
-            C_OC_new = TileExpansion(C_OC, Cnew.dot_O(Cexp))
-
             # Expansion subspace Hamiltonian:
             HCexp = el.hamiltonian(Cexp)
             del Cexp
-            C_HC = torch.diag_embed(el.eig)
-            C_HC_new = TileExpansion(C_HC, Cnew ^ HCexp)
+            C_HC_new = TileExpansion(el.eig, Cnew ^ HCexp, lower_only=True, out=ws_HC)
 
-            # Solve expanded subspace generalized eigenvalue problem:
-            eig_new, V_new = eighg(C_HC_new, C_OC_new.wait())
+            # Solve expanded subspace eigenvalue problem (standard, since
+            # Cnew is orthonormal by construction):
+            # (FP32 when far from convergence, if mixed_precision enabled;
+            # errors in the rotation are refined by subsequent iterations,
+            # but FP32 rotations keep el.C orthonormal only to ~1e-7, which
+            # bounds final accuracy as noted in the mixed_precision doc)
+            if self.mixed_precision and (el.deig_max > 1e-4):
+                eig_new, V_new = batched_eigh(C_HC_new.wait().to(torch.complex64))
+                eig_new = eig_new.to(torch.double)
+                V_new = V_new.to(torch.complex128)
+            else:
+                eig_new, V_new = batched_eigh(C_HC_new.wait())
             n_bands_next = min(n_bands_new, n_bands_max)  # number to retain
             V_new = V_new[..., :n_bands_next]  # drop extra bands
-            Vcur, Vexp = V_new.split((n_bands_cur, n_bands_exp), dim=2)
 
             # Update C and HC to optimum n_bands_next subspace from Cnew:
+            # (concatenating HC with HCexp allows a single GEMM against
+            # V_new, instead of separate multiplies by its two row blocks)
             el.C = Cnew @ V_new
             del Cnew
-            HC = HC @ Vcur
-            HC += HCexp @ Vexp
-            del HCexp
+            HCnew = HC.cat(HCexp, clear=True)  # this clears HC and HCexp memory
+            HC = HCnew @ V_new
+            del HCnew
             deig = torch.abs(el.eig - eig_new[..., :n_bands_cur])
             el.eig = eig_new[..., :n_bands_next]
 
@@ -237,28 +307,50 @@ class Davidson(TreeNode):
     diagonalize = __call__
 
 
+@torch.jit.script
+def _precondition(
+    coeff: torch.Tensor, ke: torch.Tensor, KEref: torch.Tensor
+) -> torch.Tensor:
+    """Fused elementwise kernel underlying :meth:`Davidson.precondition`.
+    JIT compilation fuses the divide / exp / add / divide chain into a
+    single pass through `coeff`, which is strictly memory-bound."""
+    x = ke[None, :, None, None, :] / KEref[..., None, None]
+    return coeff / (x + torch.exp(-x))  # x + exp(-x) avoids issues at x ~ 0
+
+
 @dataclass
 class TileExpansion:
     """Helper class to tile current and expansion subspace matrices for Davidson.
     Implements Waitable protocol to support delayed evaluation."""
 
-    C_XC: torch.Tensor  #: C^X(C) for operator X (typically O or H)
+    C_XC_diag: torch.Tensor  #: diagonal of C^X(C) for operator X (typically H);
+    #: full matrix is diagonal since C is an eigenbasis of X
     Cnew_XCexp: Waitable[
         torch.Tensor
     ]  #: future result of Cnew^X(Cexp), where Cnew = cat(C, Cexp)
+    lower_only: bool = False  #: if True, only fill lower triangle of the result
+    #: (sufficient when consumed solely by cholesky / eigh with default UPLO)
+    out: Optional[torch.Tensor] = None  #: optional persistent workspace to fill,
+    #: with band dimensions at least as large as those of the result
 
     def wait(self) -> torch.Tensor:
         Cnew_XCexp = self.Cnew_XCexp.wait()
         n_spins, nk_mine, n_bands_new, n_bands_exp = Cnew_XCexp.shape
         n_bands_cur = n_bands_new - n_bands_exp
         C_XCexp, Cexp_XCexp = Cnew_XCexp.split((n_bands_cur, n_bands_exp), dim=2)
-        result = torch.zeros(
-            (n_spins, nk_mine, n_bands_new, n_bands_new),
-            device=C_XCexp.device,
-            dtype=C_XCexp.dtype,
-        )
-        result[:, :, :n_bands_cur, :n_bands_cur] += self.C_XC  # add to broadcast
-        result[:, :, :n_bands_cur, n_bands_cur:] = C_XCexp
+        if self.out is None:
+            result = torch.empty(
+                (n_spins, nk_mine, n_bands_new, n_bands_new),
+                device=C_XCexp.device,
+                dtype=C_XCexp.dtype,
+            )
+        else:
+            result = self.out[:, :, :n_bands_new, :n_bands_new]
+        C_XC_block = result[:, :, :n_bands_cur, :n_bands_cur]
+        C_XC_block.zero_()  # diagonal block: write eigenvalues in-place,
+        C_XC_block.diagonal(dim1=-2, dim2=-1).copy_(self.C_XC_diag)  # no diag_embed
+        if not self.lower_only:
+            result[:, :, :n_bands_cur, n_bands_cur:] = C_XCexp
         result[:, :, n_bands_cur:, :n_bands_cur] = dagger(C_XCexp)
         result[:, :, n_bands_cur:, n_bands_cur:] = Cexp_XCexp
         return result
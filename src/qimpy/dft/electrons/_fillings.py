@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Optional, Union, NamedTuple, Callable, Sequence
+import math
 
 import numpy as np
 import torch
@@ -12,6 +13,19 @@ from qimpy.io import CheckpointPath, CheckpointContext, fmt, Default, cast_defau
 from qimpy.mpi import BufferView, globalreduce
 
 
+try:
+    import numba
+
+    NUMBA_AVAILABLE: bool = True  #: Whether numba is available (CPU smearing)
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+_SQRT_PI_INV = 1.0 / math.sqrt(math.pi)  #: Gaussian normalization in smearing
+_SQRT2 = math.sqrt(2.0)  #: Cold-smearing coefficient
+_SQRT_HALF = math.sqrt(0.5)  #: Cold-smearing center offset
+
+
 class SmearingResults(NamedTuple):
     f: torch.Tensor  #: Occupation factors
     f_eig: torch.Tensor  #: Energy derivative of occupation factor
@@ -350,40 +364,60 @@ class Fillings(TreeNode):
                 dim=(2, 3, 4)
             )
             # Collect across MPI and make consistent to machine precision:
+            # (packed into one buffer => single collective and host transfer)
+            n_NM = len(NM)
+            NM_flat = torch.cat((NM, NM_mu_B.flatten()))
             rc.current_stream_synchronize()
-            for tensor in (NM, NM_mu_B):
-                el.kpoints.comm.Allreduce(MPI.IN_PLACE, BufferView(tensor), MPI.SUM)
-                el.comm.Bcast(BufferView(tensor))
+            el.kpoints.comm.Allreduce(MPI.IN_PLACE, BufferView(NM_flat), MPI.SUM)
+            el.comm.Bcast(BufferView(NM_flat))
             self.f = f
             self.f_eig = f_eig
-            results["NM"] = NM
+            results["NM"] = NM_flat[:n_NM]
             results["S"] = S
             # Compute errors:
-            NM_err = NM.to(rc.cpu).numpy() - NM_target
-            NM_err_mu_B = NM_mu_B.to(rc.cpu).numpy()
+            NM_flat_np = NM_flat.to(rc.cpu).numpy()
+            NM_err = NM_flat_np[:n_NM] - NM_target
+            NM_err_mu_B = NM_flat_np[n_NM:].reshape(n_NM, n_NM)
             return NM_err[i_free], NM_err_mu_B[i_free][:, i_free]
 
         if len(i_free) == 0:
             sigma_cur = self.sigma
             compute_NM(np.array([]))  # both mu and B are fixed
         elif not self.M_constrain:
-            # Only mu is free: use a stable bracketing algorithm
-            # --- Find a bracketing interval:
-            def root_func1d(mu: float) -> float:
-                return compute_NM(np.full(1, mu))[0][0]
-
-            def expand_range(sign: int) -> float:
-                mu_limit = self.mu
-                dmu = sign * sigma_cur
-                while sign * root_func1d(mu_limit) <= 0.0:
-                    mu_limit += dmu
-                    dmu *= 2.0
-                return mu_limit
-
+            # Only mu is free: Newton-Raphson using the analytic derivative
+            # from compute_NM, which converges in a handful of iterations
+            # since N(mu) is monotonic (each iteration costs a full smearing
+            # evaluation and an allreduce, so fewer iterations matter):
             sigma_cur = self.sigma
-            mu_min = expand_range(-1)
-            mu_max = expand_range(+1)
-            self.mu = optimize.brentq(root_func1d, mu_min, mu_max)
+            mu = self.mu
+            converged = False
+            for _ in range(20):
+                N_err, N_err_mu = compute_NM(np.full(1, mu))
+                if abs(N_err[0]) <= 1e-12 * max(1.0, self.n_electrons):
+                    converged = True
+                    break
+                dmu = N_err[0] / N_err_mu[0, 0]
+                if not np.isfinite(dmu):
+                    break  # derivative too small: Newton unreliable here
+                mu -= dmu
+            if converged:
+                self.mu = mu
+            else:
+                # Fall back to a stable bracketing algorithm:
+                def root_func1d(mu: float) -> float:
+                    return compute_NM(np.full(1, mu))[0][0]
+
+                def expand_range(sign: int) -> float:
+                    mu_limit = self.mu
+                    dmu = sign * sigma_cur
+                    while sign * root_func1d(mu_limit) <= 0.0:
+                        mu_limit += dmu
+                        dmu *= 2.0
+                    return mu_limit
+
+                mu_min = expand_range(-1)
+                mu_max = expand_range(+1)
+                self.mu = optimize.brentq(root_func1d, mu_min, mu_max)
         else:  # B is free: use a quasi-Newton method
             # Find mu and/or B to match N and/or M as appropriate:
             # --- start with a larger sigma and reduce down for stability:
@@ -469,25 +503,56 @@ class Fillings(TreeNode):
         return n_bands_in
 
 
+@torch.jit.script
+def _smearing_fermi_kernel(eig_mu: torch.Tensor, sigma: float) -> SmearingResults:
+    minus_2_inv_sigma = -2.0 / sigma  # sigma = 2 kT here
+    f = torch.special.expit(eig_mu * minus_2_inv_sigma)
+    f_eig = f * (1 - f) * minus_2_inv_sigma
+    S = -f.xlogy(f) - (1 - f).xlogy(1 - f)
+    return SmearingResults(f, f_eig, S)
+
+
 def _smearing_fermi(
     eig: torch.Tensor, mu: Union[float, torch.Tensor], sigma: float
 ) -> SmearingResults:
     """Compute Fermi-Dirac occupations, its energy derivative and entropy.
-    Note that sigma is taken as 2 kT to keep width consistent."""
-    f = torch.special.expit((mu - eig) / (0.5 * sigma))
-    f_eig = f * (1 - f) / (-0.5 * sigma)
-    S = -f.xlogy(f) - (1 - f).xlogy(1 - f)
+    Note that sigma is taken as 2 kT to keep width consistent.
+    The elementwise chain is JIT-fused into a single kernel."""
+    eig_mu = eig - mu
+    if NUMBA_AVAILABLE and not eig_mu.is_cuda:
+        return _smearing_numba(_smearing_fermi_numba, eig_mu, sigma)
+    return _smearing_fermi_kernel(eig_mu, sigma)
+
+
+@torch.jit.script
+def _smearing_gauss_kernel(eig_mu: torch.Tensor, sigma: float) -> SmearingResults:
+    inv_sigma = 1.0 / sigma
+    x = eig_mu * inv_sigma
+    f = 0.5 * torch.erfc(x)
+    S = torch.exp(-x * x) * _SQRT_PI_INV
+    f_eig = -inv_sigma * S
     return SmearingResults(f, f_eig, S)
 
 
 def _smearing_gauss(
     eig: torch.Tensor, mu: Union[float, torch.Tensor], sigma: float
 ) -> SmearingResults:
-    """Compute Gaussian (erfc) occupations, energy derivative and entropy."""
-    x = (eig - mu) / sigma
-    f = 0.5 * torch.erfc(x)
-    S = torch.exp(-x * x) / np.sqrt(np.pi)
-    f_eig = (-1.0 / sigma) * S
+    """Compute Gaussian (erfc) occupations, energy derivative and entropy.
+    The elementwise chain is JIT-fused into a single kernel."""
+    eig_mu = eig - mu
+    if NUMBA_AVAILABLE and not eig_mu.is_cuda:
+        return _smearing_numba(_smearing_gauss_numba, eig_mu, sigma)
+    return _smearing_gauss_kernel(eig_mu, sigma)
+
+
+@torch.jit.script
+def _smearing_mp1_kernel(eig_mu: torch.Tensor, sigma: float) -> SmearingResults:
+    inv_sigma = 1.0 / sigma
+    x = eig_mu * inv_sigma
+    gaussian = torch.exp(-x * x) * _SQRT_PI_INV
+    f = 0.5 * (torch.erfc(x) - x * gaussian)
+    f_eig = (x * x - 1.5) * gaussian * inv_sigma
+    S = (0.5 - x * x) * gaussian
     return SmearingResults(f, f_eig, S)
 
 
@@ -495,26 +560,99 @@ def _smearing_mp1(
     eig: torch.Tensor, mu: Union[float, torch.Tensor], sigma: float
 ) -> SmearingResults:
     """Compute first-order Methfessel-Paxton occupations, energy derivative
-    and entropy."""
-    x = (eig - mu) / sigma
-    gaussian = torch.exp(-x * x) / np.sqrt(np.pi)
-    f = 0.5 * (torch.erfc(x) - x * gaussian)
-    f_eig = (x * x - 1.5) * gaussian / sigma
-    S = (0.5 - x * x) * gaussian
+    and entropy. The elementwise chain is JIT-fused into a single kernel."""
+    eig_mu = eig - mu
+    if NUMBA_AVAILABLE and not eig_mu.is_cuda:
+        return _smearing_numba(_smearing_mp1_numba, eig_mu, sigma)
+    return _smearing_mp1_kernel(eig_mu, sigma)
+
+
+@torch.jit.script
+def _smearing_cold_kernel(eig_mu: torch.Tensor, sigma: float) -> SmearingResults:
+    inv_sigma = 1.0 / sigma
+    x = eig_mu * inv_sigma + _SQRT_HALF  # note: not centered at mu
+    gaussian = torch.exp(-x * x) * _SQRT_PI_INV
+    f = 0.5 * (torch.erfc(x) + _SQRT2 * gaussian)
+    f_eig = -gaussian * (1 + x * _SQRT2) * inv_sigma
+    S = gaussian * x * _SQRT2
     return SmearingResults(f, f_eig, S)
 
 
 def _smearing_cold(
     eig: torch.Tensor, mu: Union[float, torch.Tensor], sigma: float
 ) -> SmearingResults:
-    """Compute Cold smearing occupations, energy derivative and entropy."""
-    x = (eig - mu) / sigma + np.sqrt(0.5)  # note: not centered at mu
-    sqrt2 = np.sqrt(2.0)
-    gaussian = torch.exp(-x * x) / np.sqrt(np.pi)
-    f = 0.5 * (torch.erfc(x) + sqrt2 * gaussian)
-    f_eig = -gaussian * (1 + x * sqrt2) / sigma
-    S = gaussian * x * sqrt2
-    return SmearingResults(f, f_eig, S)
+    """Compute Cold smearing occupations, energy derivative and entropy.
+    The elementwise chain is JIT-fused into a single kernel."""
+    eig_mu = eig - mu
+    if NUMBA_AVAILABLE and not eig_mu.is_cuda:
+        return _smearing_numba(_smearing_cold_numba, eig_mu, sigma)
+    return _smearing_cold_kernel(eig_mu, sigma)
+
+
+if NUMBA_AVAILABLE:
+    # Parallel CPU kernels: ATen dispatch overhead dominates the scripted
+    # path for typical eigenvalue-tensor sizes when running without CUDA.
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _smearing_fermi_numba(eig_mu, sigma, f, f_eig, S):  # type: ignore
+        minus_2_inv_sigma = -2.0 / sigma
+        for i in numba.prange(eig_mu.size):
+            fi = 1.0 / (1.0 + math.exp(-eig_mu[i] * minus_2_inv_sigma))
+            f[i] = fi
+            f_eig[i] = fi * (1 - fi) * minus_2_inv_sigma
+            Si = 0.0
+            if fi > 0.0:
+                Si -= fi * math.log(fi)
+            if fi < 1.0:
+                Si -= (1 - fi) * math.log(1 - fi)
+            S[i] = Si
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _smearing_gauss_numba(eig_mu, sigma, f, f_eig, S):  # type: ignore
+        inv_sigma = 1.0 / sigma
+        for i in numba.prange(eig_mu.size):
+            x = eig_mu[i] * inv_sigma
+            Si = math.exp(-x * x) * _SQRT_PI_INV
+            f[i] = 0.5 * math.erfc(x)
+            f_eig[i] = -inv_sigma * Si
+            S[i] = Si
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _smearing_mp1_numba(eig_mu, sigma, f, f_eig, S):  # type: ignore
+        inv_sigma = 1.0 / sigma
+        for i in numba.prange(eig_mu.size):
+            x = eig_mu[i] * inv_sigma
+            gaussian = math.exp(-x * x) * _SQRT_PI_INV
+            f[i] = 0.5 * (math.erfc(x) - x * gaussian)
+            f_eig[i] = (x * x - 1.5) * gaussian * inv_sigma
+            S[i] = (0.5 - x * x) * gaussian
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _smearing_cold_numba(eig_mu, sigma, f, f_eig, S):  # type: ignore
+        inv_sigma = 1.0 / sigma
+        for i in numba.prange(eig_mu.size):
+            x = eig_mu[i] * inv_sigma + _SQRT_HALF
+            gaussian = math.exp(-x * x) * _SQRT_PI_INV
+            f[i] = 0.5 * (math.erfc(x) + _SQRT2 * gaussian)
+            f_eig[i] = -gaussian * (1 + x * _SQRT2) * inv_sigma
+            S[i] = gaussian * x * _SQRT2
+
+
+def _smearing_numba(
+    kernel: Callable, eig_mu: torch.Tensor, sigma: float
+) -> SmearingResults:
+    """Evaluate numba-compiled smearing `kernel` on a CPU tensor `eig_mu`."""
+    eig_mu_np = eig_mu.contiguous().view(-1).numpy()
+    f = np.empty_like(eig_mu_np)
+    f_eig = np.empty_like(eig_mu_np)
+    S = np.empty_like(eig_mu_np)
+    kernel(eig_mu_np, sigma, f, f_eig, S)
+    shape = eig_mu.shape
+    return SmearingResults(
+        torch.from_numpy(f).view(shape),
+        torch.from_numpy(f_eig).view(shape),
+        torch.from_numpy(S).view(shape),
+    )
 
 
 _smearing_funcs: dict[str, SmearingFunc] = {
@@ -281,9 +281,12 @@ class Berendsen(TreeNode):
     def extra_acceleration(self, velocity: Gradient) -> Gradient:
         """Extra velocity-dependent acceleration due to thermostat/barostat."""
         dynamics = self.dynamics
-        T = dynamics.get_T(dynamics.get_KE(velocity.ions))
-        gamma = 0.5 * (T / dynamics.T0 - 1.0) / dynamics.t_damp_T
-        acceleration = Gradient(ions=(-gamma * velocity.ions))
+        # Rescaling rate gamma = 0.5 (T/T0 - 1) / t_damp_T with T = 2 KE / nDOF,
+        # kept as an on-device scalar (no .item() sync in the step path):
+        KE = 0.5 * (dynamics.masses * velocity.ions.square()).sum()
+        KE_scale = 1.0 / (0.5 * dynamics.nDOF * dynamics.T0)
+        gamma = (KE * KE_scale - 1.0) * (0.5 / dynamics.t_damp_T)
+        acceleration = Gradient(ions=(velocity.ions * (-gamma)))
         # Optional barostat contributions:
         if dynamics.system.lattice.movable:
             dstress = dynamics.stress0 - dynamics.get_stress(velocity.ions)
@@ -295,6 +298,19 @@ class Berendsen(TreeNode):
 
     def step(self, velocity: Gradient, acceleration: Gradient, dt: float) -> Gradient:
         """Return velocity after `dt`, given current `velocity` and `acceleration`."""
+        dynamics = self.dynamics
+        if not dynamics.system.lattice.movable:
+            # Fused ions-only fast path (no barostat contributions):
+            ions = _berendsen_step_nvt(
+                velocity.ions,
+                acceleration.ions,
+                dynamics.masses,
+                dynamics.T0,
+                dynamics.nDOF,
+                dynamics.t_damp_T,
+                dt,
+            )
+            return Gradient(ions=ions)
         return second_order_step(velocity, acceleration, self.extra_acceleration, dt)
 
     def initialize_gradient(self, gradient: Gradient) -> None:
@@ -311,6 +327,10 @@ class Langevin(TreeNode):
     """Langevin stochastic thermostat and/or barostat."""
 
     dynamics: geometry.Dynamics
+    _rand_pool: Optional[torch.Tensor]  #: batched random samples (see `_next_rand`)
+    _rand_idx: int  #: index of next unused sample in `_rand_pool`
+
+    RAND_POOL_SIZE: int = 64  #: number of MD steps of noise generated per Bcast
 
     def __init__(
         self,
@@ -320,18 +340,52 @@ class Langevin(TreeNode):
     ) -> None:
         super().__init__()
         self.dynamics = dynamics
+        self._rand_pool = None
+        self._rand_idx = 0
 
     def extra_acceleration(self, velocity: Gradient) -> Gradient:
         """Extra velocity-dependent acceleration due to thermostat."""
         return velocity * (-1.0 / self.dynamics.t_damp_T)
 
+    def _next_rand(self, velocity_ions: torch.Tensor) -> torch.Tensor:
+        """Get MPI-consistent standard-normal sample for one step.
+        Samples are generated and broadcast `RAND_POOL_SIZE` steps at a time,
+        amortizing the per-step MPI latency of synchronizing the noise."""
+        pool = self._rand_pool
+        if (
+            (pool is None)
+            or (self._rand_idx >= len(pool))
+            or (pool.shape[1:] != velocity_ions.shape)
+        ):
+            pool = torch.randn(
+                (self.RAND_POOL_SIZE,) + tuple(velocity_ions.shape),
+                dtype=velocity_ions.dtype,
+                device=velocity_ions.device,
+            )
+            self.dynamics.comm.Bcast(BufferView(pool))
+            self._rand_pool = pool
+            self._rand_idx = 0
+        rand = pool[self._rand_idx]
+        self._rand_idx += 1
+        return rand
+
     def step(self, velocity: Gradient, acceleration: Gradient, dt: float) -> Gradient:
         """Return velocity after `dt`, given current `velocity` and `acceleration`."""
         dynamics = self.dynamics
         # Generate MPI-consistent stochastic acceleration (not velocity dependent):
-        rand = torch.randn_like(velocity.ions)
-        self.dynamics.comm.Bcast(BufferView(rand))
+        rand = self._next_rand(velocity.ions)
         variances = 2 * dynamics.T0 / (dynamics.masses * (dynamics.t_damp_T * dt))
+        if not dynamics.system.lattice.movable:
+            # Fused ions-only fast path (single scripted kernel sequence):
+            ions = _langevin_step_nvt(
+                velocity.ions,
+                acceleration.ions,
+                rand,
+                variances.sqrt(),
+                dynamics.t_damp_T,
+                dt,
+            )
+            return Gradient(ions=ions)
         acceleration_noise = Gradient(ions=(rand * variances.sqrt()))
         # Take step including velocity-dependent damping:
         return second_order_step(
@@ -348,6 +402,45 @@ class Langevin(TreeNode):
         """No optional velocity components for this thermostat method."""
 
 
+@torch.jit.script
+def _langevin_step_nvt(
+    v: torch.Tensor,
+    a0: torch.Tensor,
+    rand: torch.Tensor,
+    noise_scale: torch.Tensor,
+    t_damp_T: float,
+    dt: float,
+) -> torch.Tensor:
+    """Ions-only Langevin update of `second_order_step`, fused into one
+    kernel sequence (analogous to `_berendsen_step_nvt`)."""
+    inv_t_damp = 1.0 / t_damp_T
+    a_total = a0 + rand * noise_scale
+    v_half = v + (a_total - v * inv_t_damp) * (0.5 * dt)
+    return v + (a_total - v_half * inv_t_damp) * dt
+
+
+@torch.jit.script
+def _berendsen_step_nvt(
+    v: torch.Tensor,
+    a0: torch.Tensor,
+    masses: torch.Tensor,
+    T0: float,
+    nDOF: int,
+    t_damp_T: float,
+    dt: float,
+) -> torch.Tensor:
+    """Ions-only Berendsen update of `second_order_step`, fused into one
+    kernel sequence on plain tensors (no intermediate Gradient objects)."""
+    half_damp = 0.5 / t_damp_T
+    KE_scale = 1.0 / (0.5 * float(nDOF) * T0)  # converts KE to T / T0
+    KE = 0.5 * (masses * v.square()).sum()
+    gamma = (KE * KE_scale - 1.0) * half_damp
+    v_half = v + (a0 - gamma * v) * (0.5 * dt)
+    KE_half = 0.5 * (masses * v_half.square()).sum()
+    gamma_half = (KE_half * KE_scale - 1.0) * half_damp
+    return v + (a0 - gamma_half * v_half) * dt
+
+
 def second_order_step(
     velocity: Gradient,
     acceleration0: Gradient,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 from typing import Optional, Union
 import pathlib
@@ -17,6 +18,59 @@ from qimpy.grid import FieldH
 from . import Pseudopotential, _ions_projectors, _ions_atomic, _ions_update
 
 
+try:
+    import numba
+
+    NUMBA_AVAILABLE: bool = True  #: Whether numba is available (attribute fill)
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _fill_attributes(values, mask, n_cols):  # type: ignore
+        """Scatter flat per-ion `values` to rows selected by `mask`.
+        Unselected rows are filled with the zero default."""
+        out = np.zeros((mask.size, n_cols))
+        i_value = 0
+        for i_ion in range(mask.size):
+            if mask[i_ion]:
+                for i_col in range(n_cols):
+                    out[i_ion, i_col] = values[i_value]
+                    i_value += 1
+        return out
+
+else:
+
+    def _fill_attributes(
+        values: np.ndarray, mask: np.ndarray, n_cols: int
+    ) -> np.ndarray:
+        """Scatter flat per-ion `values` to rows selected by `mask`.
+        Unselected rows are filled with the zero default."""
+        out = np.zeros((mask.size, n_cols))
+        out[mask] = values.reshape(-1, n_cols)
+        return out
+
+
+@functools.lru_cache
+def _dir_entries(parent: str) -> frozenset[str]:
+    """Cached directory listing (empty if `parent` cannot be scanned)."""
+    try:
+        with os.scandir(parent if parent else ".") as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _file_exists(filename: str) -> bool:
+    """Check file existence using cached directory listings.
+    Each pseudopotential search directory is scanned only once, instead
+    of issuing a stat per (symbol, template, case-variant) combination."""
+    parent, name = os.path.split(filename)
+    return name in _dir_entries(parent)
+
+
 class Ions(TreeNode):
     """Ionic system: ionic geometry and pseudopotentials."""
 
@@ -27,6 +81,7 @@ class Ions(TreeNode):
     n_ions_type: list[int]  #: number of ions of each type
     symbols: list[str]  #: symbol for each ion type
     slices: list[slice]  #: slice to get each ion type
+    type_offsets: torch.Tensor  #: start offset of each type's ions (n_types + 1)
     pseudopotentials: list[Pseudopotential]  #: pseudopotential for each type
     positions: torch.Tensor  #: fractional positions of each ion (n_ions x 3)
     velocities: Optional[torch.Tensor]  #: Cartesian velocities of each ion (n_ions x 3)
@@ -43,6 +98,7 @@ class Ions(TreeNode):
     beta_version: int  #: version of `beta` to invalidate cached projections
     D_all: torch.Tensor  #: nonlocal pseudopotential matrix (all atoms)
     dEtot_drho_basis: float  #: dE/d(basis function density) for Pulay correction
+    _mesh_cache: dict  #: lattice-dependent mesh quantities cached for local terms
 
     _get_projectors = _ions_projectors.get_projectors
     _projectors_grad = _ions_projectors.projectors_grad
@@ -101,6 +157,7 @@ class Ions(TreeNode):
         log.info("\n--- Initializing Ions ---")
         self.lattice = lattice
         self.fractional = fractional
+        self._mesh_cache = {}
         if checkpoint_in:
             self._read_checkpoint(checkpoint_in)
         else:
@@ -138,14 +195,12 @@ class Ions(TreeNode):
         if coordinates is None:
             coordinates = []
         assert isinstance(coordinates, list)
-        symbols: list[str] = []  # symbol for each ion type
-        n_types = 0  # number of ion types encountered so far
-        positions = []  # position of each ion
-        types = []  # type of each ion (index into symbols)
+        symbols_all: list[str] = []  # symbol of each ion
+        raw_xyz = np.empty((len(coordinates), 3))  # position of each ion
         velocities = []  # initial velocities
         Q_initial = []  # initial charge / oxidation states
         M_initial = []  # initial magnetic moments
-        for coord in coordinates:
+        for i_ion, coord in enumerate(coordinates):
             # Check for optional attributes:
             if len(coord) == 4:
                 attrib = {}
@@ -155,29 +210,26 @@ class Ions(TreeNode):
                     raise ValueError("ion attributes must be a dict")
             else:
                 raise ValueError("each ion must be 4 entries + optional dict")
-            # Add new symbol or append to existing:
-            symbol = str(coord[0])
-            if (not symbols) or (symbol != symbols[-1]):
-                symbols.append(symbol)
-                n_types += 1
-            # Add type and position of current ion:
-            types.append(n_types - 1)
-            positions.append([float(x) for x in coord[1:4]])
+            symbols_all.append(str(coord[0]))
+            raw_xyz[i_ion] = coord[1:4]  # numeric conversion within numpy
             velocities.append(attrib.get("v", None))
             Q_initial.append(attrib.get("Q", None))
             M_initial.append(attrib.get("M", None))
 
-        # Convert to tensors before storing in class object:
-        self.positions = (
-            torch.tensor(positions, device=rc.device)
-            if positions
-            else torch.empty((0, 3), device=rc.device)
-        )
+        # Assign type indices to consecutive runs of the same symbol:
+        symbols_np = np.array(symbols_all)
+        new_type = np.ones(len(symbols_np), dtype=bool)
+        new_type[1:] = symbols_np[1:] != symbols_np[:-1]
+        types = np.cumsum(new_type) - 1
+        symbols = symbols_np[new_type].tolist()
+
+        # Convert to tensors before storing in class object (single transfer):
+        self.positions = torch.from_numpy(raw_xyz).to(rc.device, non_blocking=True)
         if not self.fractional:
             # Convert Cartesian input to fractional coordinates:
             self.positions = self.positions @ self.lattice.invRbasisT
         self.positions.grad = None
-        self.types = torch.tensor(types, device=rc.device, dtype=torch.long)
+        self.types = torch.from_numpy(types).to(rc.device)
         self.symbols = symbols
         self._set_counts_slices()  # uses types and symbols, sets n_ions, slices etc.
         self.velocities = self._process_velocities(velocities)
@@ -186,24 +238,23 @@ class Ions(TreeNode):
 
     def _process_velocities(self, velocities: list) -> Optional[torch.Tensor]:
         """Fill in missing velocities (if any specified)."""
-        if velocities.count(None) == self.n_ions:
+        mask = np.array([(v is not None) for v in velocities], dtype=np.bool_)
+        if not mask.any():
             return None  # no velocities specified
-        v_default = [0.0, 0.0, 0.0]
-        return torch.tensor(
-            [(v_default if (v is None) else v) for v in velocities],
-            device=rc.device,
-            dtype=torch.double,
+        values = np.array([v for v in velocities if v is not None]).flatten()
+        return torch.from_numpy(_fill_attributes(values, mask, 3)).to(
+            rc.device, non_blocking=True
         )
 
     def _process_Q_initial(self, Q_initial: list) -> Optional[torch.Tensor]:
         """Fill in missing oxidation states (if any specified)."""
-        if Q_initial.count(None) == self.n_ions:
+        mask = np.array([(Q is not None) for Q in Q_initial], dtype=np.bool_)
+        if not mask.any():
             return None  # no charge specified
-        return torch.tensor(
-            [(0.0 if (Q is None) else Q) for Q in Q_initial],
-            device=rc.device,
-            dtype=torch.double,
-        )
+        values = np.array([Q for Q in Q_initial if Q is not None], dtype=np.float64)
+        return torch.from_numpy(_fill_attributes(values, mask, 1)).to(
+            rc.device, non_blocking=True
+        )[:, 0]
 
     def _process_M_initial(self, M_initial: list) -> Optional[torch.Tensor]:
         """Fill in missing magnetizations (if any specified)."""
@@ -216,12 +267,13 @@ class Ions(TreeNode):
             raise ValueError("All M must be same type: 3-vector or scalar")
         M_length = next(iter(M_lengths))
         assert (M_length == 1) or (M_length == 3)
-        M_default = [0.0, 0.0, 0.0] if (M_length == 3) else 0.0
-        return torch.tensor(
-            [(M_default if (M is None) else M) for M in M_initial],
-            device=rc.device,
-            dtype=torch.double,
-        )
+        mask = np.array([(M is not None) for M in M_initial], dtype=np.bool_)
+        values = np.array(
+            [M for M in M_initial if M is not None], dtype=np.float64
+        ).flatten()
+        result = torch.from_numpy(_fill_attributes(values, mask, M_length))
+        result = result.to(rc.device, non_blocking=True)
+        return result if (M_length == 3) else result[:, 0]
 
     def _get_pseudopotential_filename(
         self, symbol: str, pseudopotentials: list[str], prefixes: list[str]
@@ -235,7 +287,7 @@ class Ions(TreeNode):
                     template = os.path.join(prefix, ps_name) if prefix else ps_name
                     for symbol_variant in symbol_variants:
                         filename_test = template.replace("$ID", symbol_variant)
-                        if pathlib.Path(filename_test).exists():
+                        if _file_exists(filename_test):
                             return filename_test  # found
             else:
                 # specific filename
@@ -244,7 +296,7 @@ class Ions(TreeNode):
                 if ps_symbol in symbol_variants:
                     for prefix in prefixes:
                         filename = os.path.join(prefix, ps_name) if prefix else ps_name
-                        if pathlib.Path(filename).exists():
+                        if _file_exists(filename):
                             return filename
                     raise FileNotFoundError(ps_name)
         raise ValueError(f"no pseudopotential found for {symbol}")
@@ -270,6 +322,8 @@ class Ions(TreeNode):
         Q = None if (self.Q is None) else self.Q.to(rc.cpu).numpy()
         M = None if (self.M is None) else self.M.to(rc.cpu).numpy()
         any_attribs = not ((v is None) and (Q is None) and (M is None))
+        # Batch-format all ions into one logger call (avoids per-ion IO stalls):
+        lines = []
         for i_ion, (pos_x, pos_y, pos_z) in enumerate(positions):
             if any_attribs:
                 # Generate attribute string:
@@ -285,20 +339,23 @@ class Ions(TreeNode):
                 attrib_str = f", {attrib_str}"
             else:
                 attrib_str = ""
-            # Report:
-            log.info(
+            lines.append(
                 f"- [{self.symbols[types[i_ion]]},"
                 f" {pos_x:11.8f}, {pos_y:11.8f}, {pos_z:11.8f}{attrib_str}]"
             )
+        if lines:
+            log.info("\n".join(lines))
 
         # Report forces / stresses if requested:
         if report_grad:
             forces = self.forces.detach().to(rc.cpu).numpy()
-            log.info("\nforces:  # in Cartesian [Eh/a0] coordinates")
-            for type_i, (fx, fy, fz) in zip(types, forces):
-                log.info(
+            log.info(
+                "\nforces:  # in Cartesian [Eh/a0] coordinates\n"
+                + "\n".join(
                     f"- [{self.symbols[type_i]}, {fx:11.8f}, {fy:11.8f}, {fz:11.8f}]"
+                    for type_i, (fx, fy, fz) in zip(types, forces)
                 )
+            )
         log.info("")
 
     def translation_phase(
@@ -389,6 +446,11 @@ class Ions(TreeNode):
             slice(slice_end - slice_len, slice_end)
             for slice_end, slice_len in zip(slice_ends, self.n_ions_type)
         ]
+        # CSR-style offsets equivalent to `slices`, for tensor-side dispatch
+        # (ions are guaranteed contiguous by type, checked above):
+        self.type_offsets = torch.tensor(
+            [0] + slice_ends, device=rc.device, dtype=torch.long
+        )
 
     @property
     def labeled_positions(self) -> Optional[LabeledPositions]:
@@ -120,34 +120,67 @@ class _LocalTerms:
         self.ions = ions
         self.system = system
 
-        # Prepare interpolator for grid:
+        # Prepare interpolator for grid. The mesh quantities and Gaussian
+        # envelope depend only on the lattice and ion width (not on ionic
+        # positions), so they are cached on `ions` across MD steps:
         grid = system.grid
-        self.iG = grid.get_mesh("H").to(torch.double)  # half-space
-        G = self.iG @ grid.lattice.Gbasis.T
-        Gsq = G.square().sum(dim=-1)
-        Gmag = Gsq.sqrt()
-        self.Ginterp = Interpolator(Gmag, RadialFunction.DG)
+        ion_width = system.coulomb.ion_width
+        cache = ions._mesh_cache
+        if (
+            (cache.get("grid") is not grid)
+            or (cache.get("Gbasis") is not grid.lattice.Gbasis)
+            or (cache.get("ion_width") != ion_width)
+        ):
+            iG = grid.get_mesh("H").to(torch.double)  # half-space
+            G = iG @ grid.lattice.Gbasis.T
+            Gsq = G.square().sum(dim=-1)
+            Gmag = Gsq.sqrt()
+            cache.clear()
+            cache.update(
+                grid=grid,
+                Gbasis=grid.lattice.Gbasis,
+                ion_width=ion_width,
+                iG=iG,
+                G=G,
+                Gmag=Gmag,
+                Ginterp=Interpolator(Gmag, RadialFunction.DG),
+                envelope=torch.exp((-0.5 * (ion_width**2)) * Gsq),
+            )
+        self.iG = cache["iG"]
+        Gmag = cache["Gmag"]
+        self.Ginterp = cache["Ginterp"]
 
-        # Collect structure factor and radial coefficients:
-        Vloc_coeff = []
-        n_core_coeff = []
+        # Collect radial coefficients (fixed unless Gmax / ion width change).
+        # Vloc and n_core splines are stacked into one tensor so that each
+        # Interpolator application below covers both in a single evaluation:
         Gmax = grid.get_Gmax()
-        ion_width = system.coulomb.ion_width
-        for i_type, ps in enumerate(ions.pseudopotentials):
-            ps.update(Gmax, ion_width, system.electrons.comm)
-            Vloc_coeff.append(ps.Vloc.f_tilde_coeff)
-            n_core_coeff.append(ps.n_core.f_tilde_coeff)
-        self.Vloc_coeff = torch.hstack(Vloc_coeff)
-        self.n_core_coeff = torch.hstack(n_core_coeff)
-        self.rho_kernel = -ions.Z.view(-1, 1, 1, 1) * torch.exp(
-            (-0.5 * (ion_width**2)) * Gsq
-        )
+        if cache.get("Gmax") != Gmax:
+            for ps in ions.pseudopotentials:
+                ps.update(Gmax, ion_width, system.electrons.comm)
+            cache["Gmax"] = Gmax
+            # Fill a preallocated stack by slice assignment (no hstack copy):
+            coeffs = [ps.Vloc.f_tilde_coeff for ps in ions.pseudopotentials] + [
+                ps.n_core.f_tilde_coeff for ps in ions.pseudopotentials
+            ]
+            n_cols = sum(coeff.shape[1] for coeff in coeffs)
+            local_coeff = torch.empty(
+                (coeffs[0].shape[0], n_cols),
+                dtype=coeffs[0].dtype,
+                device=coeffs[0].device,
+            )
+            i_col = 0
+            for coeff in coeffs:
+                local_coeff[:, i_col : i_col + coeff.shape[1]] = coeff
+                i_col += coeff.shape[1]
+            cache["local_coeff"] = local_coeff
+        self.local_coeff = cache["local_coeff"]
+        self.rho_kernel = -ions.Z.view(-1, 1, 1, 1) * cache["envelope"]
 
         # Extra requirements for lattice gradient:
         if ions.lattice.requires_grad:
             self.Ginterp_prime = Interpolator(Gmag, RadialFunction.DG, deriv=1)
             self.rho_kernel_prime = self.rho_kernel * (-(ion_width**2)) * Gmag
-            G = G.permute(3, 0, 1, 2)  # bring gradient direction to front
+            G = cache["G"].permute(3, 0, 1, 2)  # bring gradient direction to front
             self.stress_kernel = FieldH(
                 grid,
                 data=(
@@ -160,8 +193,9 @@ class _LocalTerms:
         """Update ionic densities and potentials."""
         ions = self.ions
         SF = self.get_structure_factor()
-        ions.Vloc_tilde.data = (SF * self.Ginterp(self.Vloc_coeff)).sum(dim=0)
-        ions.n_core_tilde.data[0] = (SF * self.Ginterp(self.n_core_coeff)).sum(dim=0)
+        Vloc_t, n_core_t = self.Ginterp(self.local_coeff).tensor_split(2)
+        ions.Vloc_tilde.data = (SF * Vloc_t).sum(dim=0)
+        ions.n_core_tilde.data[0] = (SF * n_core_t).sum(dim=0)
         ions.rho_tilde.data = (SF * self.rho_kernel).sum(dim=0)
         # Add long-range part of local potential from ionic charge:
         ions.Vloc_tilde += self.system.coulomb(ions.rho_tilde, correct_G0_width=True)
@@ -180,9 +214,10 @@ class _LocalTerms:
             )
 
         # Propagate to structure factor gradient:
+        Vloc_t, n_core_t = self.Ginterp(self.local_coeff).tensor_split(2)
         SF_grad = (
-            self.Ginterp(self.Vloc_coeff) * ions.Vloc_tilde.grad.data
-            + self.Ginterp(self.n_core_coeff) * ions.n_core_tilde.grad.data[0]
+            Vloc_t * ions.Vloc_tilde.grad.data
+            + n_core_t * ions.n_core_tilde.grad.data[0]
             + self.rho_kernel * ions.rho_tilde.grad.data
         )
         # Propagate to ionic gradient:
@@ -191,9 +226,10 @@ class _LocalTerms:
         if ions.lattice.requires_grad:
             # Propagate to radial function gradient:
             SF = self.get_structure_factor()
+            Vloc_p, n_core_p = self.Ginterp_prime(self.local_coeff).tensor_split(2)
             radial_part = (
-                self.Ginterp_prime(self.Vloc_coeff) * ions.Vloc_tilde.grad.data
-                + self.Ginterp_prime(self.n_core_coeff) * ions.n_core_tilde.grad.data[0]
+                Vloc_p * ions.Vloc_tilde.grad.data
+                + n_core_p * ions.n_core_tilde.grad.data[0]
                 + self.rho_kernel_prime * ions.rho_tilde.grad.data
             )
             radial_grad = FieldH(
@@ -203,14 +239,15 @@ class _LocalTerms:
             ions.lattice.grad += radial_grad ^ self.stress_kernel
 
     def get_structure_factor(self) -> torch.Tensor:
-        """Compute structure factor."""
-        inv_volume = 1.0 / self.system.lattice.volume
-        return torch.stack(
-            [
-                self.ions.translation_phase(self.iG, slice_i).sum(dim=-1) * inv_volume
-                for slice_i in self.ions.slices
-            ]
+        """Compute structure factor (one entry per ion type)."""
+        ions = self.ions
+        phase = ions.translation_phase(self.iG)  # one GEMM over all ions
+        SF = torch.zeros(
+            (ions.n_types,) + phase.shape[:-1], dtype=phase.dtype, device=phase.device
         )
+        SF.index_add_(0, ions.types, phase.movedim(-1, 0))  # segment-sum over types
+        SF *= 1.0 / self.system.lattice.volume
+        return SF
 
     def accumulate_structure_factor_forces(self, SF_grad: torch.Tensor) -> None:
         """Propagate structure factor gradient to forces."""
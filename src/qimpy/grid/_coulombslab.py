@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Optional
+
 import numpy as np
 import torch
 from qimpy import log, grid, rc
@@ -7,6 +9,28 @@ from qimpy import log, grid, rc
 from . import Grid, FieldH
 
 
+@torch.jit.script
+def _slab_kernel(
+    Gi: torch.Tensor, iG_dir: torch.Tensor, hlfL: float, iDir: int, has_origin: bool
+):
+    """Fused elementwise construction of the slab-truncated Coulomb kernel.
+    Scripted so the exp / cos / divide chain runs in one pass, reusing a
+    single buffer instead of materializing each intermediate. The G = 0
+    entry is at mesh index (0, 0, 0) when local (`has_origin`), so it is
+    patched directly instead of a full-grid torch.where select."""
+    Gsqi = Gi.square()
+    Gsq = Gsqi.sum(dim=-1)
+    result = torch.exp(torch.sqrt(Gsq - Gsqi[..., iDir]) * (-hlfL))
+    result *= torch.cos(np.pi * iG_dir)
+    result = (1.0 - result) * (4 * np.pi)
+    if has_origin:
+        Gsq[0, 0, 0] = 1.0  # avoid 0/0 at G = 0 (overwritten below)
+    result /= Gsq
+    if has_origin:
+        result[0, 0, 0] = -2 * np.pi * hlfL * hlfL
+    return result
+
+
 class Coulomb_Slab:
     """Coulomb interactions between fields and point charges in a truncated Slab geometry"""
 
@@ -17,11 +41,13 @@ class Coulomb_Slab:
     iR: torch.Tensor  # Ewald real-space mesh points
     iG: torch.Tensor  # Ewald reciprocal-space mesh points
     _kernel: torch.Tensor  # Coulomb kernel
+    _iG_mesh: Optional[torch.Tensor]  # Cached H-space mesh (fixed for grid shape)
 
     def __init__(self, grid: Grid, n_ions: int, iDir: int) -> None:
         """Initialize truncated coulomb calculation"""
         self.iDir = iDir  # Figure out where to initialize thi
         self.grid = grid
+        self._iG_mesh = None
         h_max = (
             (grid.lattice.Rbasis.norm(dim=0).to(rc.cpu) / torch.tensor(grid.shape))
             .max()
@@ -41,17 +67,15 @@ class Coulomb_Slab:
         self.hlfL = hlfL
         log.info(f"hlfL in update_lattice_dependent: {hlfL}")
 
-        iG = grid.get_mesh("H").to(torch.double)
-        Gi = iG @ grid.lattice.Gbasis.T
-        Gsqi = Gi.square()
-        Gsq = Gsqi.sum(dim=-1)
-        Gplane = torch.sqrt(Gsq - Gsqi[..., iDir])
-        self._kernel = torch.where(
-            Gsq == 0.0,
-            -2 * np.pi * hlfL**2,
-            (4 * np.pi)
-            * (1 - torch.exp(-Gplane * hlfL) * torch.cos(np.pi * iG[..., iDir]))
-            / Gsq,
+        if self._iG_mesh is None:  # mesh is fixed for grid shape; compute once
+            self._iG_mesh = grid.get_mesh("H").to(torch.double)
+        iG = self._iG_mesh
+        self._kernel = _slab_kernel(
+            iG @ grid.lattice.Gbasis.T,
+            iG[..., iDir],
+            hlfL.item(),
+            iDir,
+            grid.i_proc == 0,  # G = 0 is local only on the first process
         )
         # Calculate the Gaussian width for the Ewald sums:
         self.sigma = (
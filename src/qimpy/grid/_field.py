@@ -70,6 +70,7 @@ class Field(Gradable[FieldType]):
         *,
         shape_batch: Sequence[int] = tuple(),
         data: Optional[torch.Tensor] = None,
+        dtype_override: Optional[torch.dtype] = None,
     ) -> None:
         """Initialize to zeros or specified `data`.
 
@@ -82,26 +83,54 @@ class Field(Gradable[FieldType]):
             scalar fields etc. Not used if data is provided.
         data
             Initial data if provided; initialize to zero otherwise
+        dtype_override
+            Optional reduced-precision storage dtype (e.g. torch.bfloat16 or
+            torch.complex32) for bandwidth-bound intermediates that tolerate
+            it, such as mixing residuals. Restore full precision (see
+            `astype`) before FFTs or accumulation into final results.
         """
         super().__init__()
         self.grid = grid
         shape_grid_mine = self.shape_grid_mine()
-        dtype = self.dtype()
+        dtype = self.dtype() if (dtype_override is None) else dtype_override
         if data is None:
-            # Initialize to zero:
-            self.data = torch.zeros(
-                tuple(shape_batch) + shape_grid_mine, dtype=dtype, device=rc.device
-            )
+            # Initialize to zero (reusing a released buffer, if available):
+            shape_full = tuple(shape_batch) + shape_grid_mine
+            pool = grid._field_pool.get((dtype, shape_full))
+            if pool:
+                self.data = pool.pop().zero_()
+            else:
+                self.data = torch.zeros(shape_full, dtype=dtype, device=rc.device)
         else:
-            # Initialize to provided data:
+            # Initialize to provided data (dtype may be a reduced-precision
+            # variant; only real vs complex kind must match the field type):
             assert data.shape[-3:] == shape_grid_mine
-            assert data.dtype == dtype
+            assert data.is_complex() == dtype.is_complex
             self.data = data
 
     def clone(self: FieldType) -> FieldType:
         """Create field with cloned data (deep copy)."""
         return self.__class__(self.grid, data=self.data.clone())
 
+    def astype(self: FieldType, dtype: torch.dtype) -> FieldType:
+        """Return field with storage cast to `dtype` (same field otherwise).
+        Use to move intermediates to reduced precision and back; returns
+        `self` unchanged if the storage dtype already matches."""
+        if dtype == self.data.dtype:
+            return self
+        return self.__class__(self.grid, data=self.data.to(dtype))
+
+    def release(self) -> None:
+        """Return `data` to the grid's buffer pool, to be reused by future
+        zero-initialized field construction on the same grid. Only call this
+        on temporaries once no other references to `data` remain; the field
+        is unusable afterwards."""
+        data = self.data
+        del self.data
+        self.grid._field_pool.setdefault((data.dtype, tuple(data.shape)), []).append(
+            data
+        )
+
     def add_(
         self: FieldType, other: Union[FieldType, float], *, alpha: float = 1.0
     ) -> FieldType:
@@ -113,6 +142,8 @@ class Field(Gradable[FieldType]):
             else:
                 self.data += other * alpha
         elif isinstance(other, type(self)):
+            # Consistency checks here and in other operators use plain assert
+            # so that python -O strips them from production SCF/CG hot loops:
             assert self.grid is other.grid
             self.data.add_(other.data, alpha=alpha)
         else:
@@ -139,20 +170,45 @@ class Field(Gradable[FieldType]):
     def __neg__(self: FieldType) -> FieldType:
         return self.__class__(self.grid, data=(-self.data))
 
-    def __mul__(self: FieldType, other: Union[FieldType, float]) -> FieldType:
-        return self.clone().__imul__(other)
-
-    __rmul__ = __mul__
-
-    def __imul__(self: FieldType, other: Union[FieldType, float]) -> FieldType:
+    def mul_(self: FieldType, other: Union[FieldType, float]) -> FieldType:
+        """Multiply in-place (mirroring torch.Tensor.mul_)."""
         if isinstance(other, float):
             self.data *= other
         elif isinstance(other, type(self)):
+            assert self.grid is other.grid
             self.data *= other.data
         else:
             return NotImplemented
         return self
 
+    def __mul__(self: FieldType, other: Union[FieldType, float]) -> FieldType:
+        return self.clone().mul_(other)
+
+    __rmul__ = __mul__
+
+    def __imul__(self: FieldType, other: Union[FieldType, float]) -> FieldType:
+        return self.mul_(other)
+
+    @staticmethod
+    def foreach_add_(
+        fields: Sequence[FieldType],
+        others: Sequence[FieldType],
+        *,
+        alpha: float = 1.0,
+    ) -> None:
+        """Add `alpha` times each of `others` to the corresponding entry of
+        `fields` in-place, fused into a single foreach kernel launch.
+        Entries must be pairwise same-type fields on the same grid."""
+        assert len(fields) == len(others)
+        for field, other in zip(fields, others):
+            assert type(field) is type(other)
+            assert field.grid is other.grid
+        torch._foreach_add_(
+            [field.data for field in fields],
+            [other.data for other in others],
+            alpha=alpha,
+        )
+
     def __truediv__(self: FieldType, other: Union[FieldType, float]) -> FieldType:
         return self.clone().__itruediv__(other)
 
@@ -202,7 +258,14 @@ class Field(Gradable[FieldType]):
         data1 = self.data.conj() if self.data.is_complex() else self.data
         data2 = other.data
         if type(self) == FieldH:
-            result = (data1 * data2).sum(dim=(-3, -2)).real @ self.grid.weight2H
+            # Single fused reduction (avoids materializing the full product
+            # and the intermediate z-resolved sums):
+            result = torch.einsum(
+                "...xyz, ...xyz, z -> ...",
+                data1,
+                data2,
+                self.grid.weight2H.to(data2.dtype),
+            ).real
         else:
             result = (data1 * data2).sum(dim=(-3, -2, -1))
         # Volume factor:
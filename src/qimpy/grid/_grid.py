@@ -41,6 +41,10 @@ class Grid(TreeNode):
     _indices_ifft: IndicesType  #: All-to-all unscramble indices for `ifft`
     _indices_rfft: IndicesType  #: All-to-all unscramble indices for `rfft`
     _indices_irfft: IndicesType  #: All-to-all unscramble indices for `irfft`
+    _field_pool: dict[
+        tuple[torch.dtype, tuple[int, ...]], list[torch.Tensor]
+    ]  #: Recycled data buffers for field construction (see `Field.release`)
+    _weight2H: Optional[torch.Tensor]  #: Cached Hermitian-symmetry weights
 
     def __init__(
         self,
@@ -84,6 +88,8 @@ class Grid(TreeNode):
         self.lattice = lattice
         self.symmetries = symmetries
         self._field_symmetrizer = None
+        self._field_pool = {}
+        self._weight2H = None
 
         # MPI settings (identify local or split):
         self.comm = comm
@@ -149,13 +155,16 @@ class Grid(TreeNode):
 
     @property
     def weight2H(self) -> torch.Tensor:
-        """Hermitian-symmetry weights for reduced reciprocal space."""
-        split2H = self.split2H
-        iz_start = max(1, split2H.i_start) - split2H.i_start
-        iz_stop = min(split2H.n_tot - 1, split2H.i_stop) - split2H.i_start
-        result = torch.ones(split2H.n_mine, device=rc.device)
-        result[iz_start:iz_stop] *= 2.0
-        return result
+        """Hermitian-symmetry weights for reduced reciprocal space.
+        Computed once and cached (depends only on the grid shape / split)."""
+        if self._weight2H is None:
+            split2H = self.split2H
+            iz_start = max(1, split2H.i_start) - split2H.i_start
+            iz_stop = min(split2H.n_tot - 1, split2H.i_stop) - split2H.i_start
+            result = torch.ones(split2H.n_mine, device=rc.device)
+            result[iz_start:iz_stop] *= 2.0
+            self._weight2H = result
+        return self._weight2H
 
     def get_mesh(self, space: str, mine: bool = True) -> torch.Tensor:
         """Get mesh integer coordinates for real or reciprocal space
@@ -5,6 +5,22 @@ import torch
 import numpy as np
 
 
+_MODIFICATIONS = {
+    "body-centered": 0.5
+    * np.array([[-1.0, 1.0, 1.0], [1.0, -1.0, 1.0], [1.0, 1.0, -1.0]]),
+    "base-centered": 0.5
+    * np.array([[1.0, -1.0, 0.0], [1.0, 1.0, 0.0], [0.0, 0.0, 2.0]]),
+    "face-centered": 0.5
+    * np.array([[0.0, 1.0, 1.0], [1.0, 0.0, 1.0], [1.0, 1.0, 0.0]]),
+}  #: transformation from base lattice for each centering modification
+
+_MODIFICATION_SYSTEMS = {
+    "body-centered": ["orthorhombic", "tetragonal", "cubic"],
+    "base-centered": ["monoclinic"],
+    "face-centered": ["orthorhombic", "cubic"],
+}  #: lattice systems compatible with each centering modification
+
+
 def get_Rbasis(
     system: str,
     modification: Optional[str],
@@ -96,24 +112,15 @@ def get_Rbasis(
     v1 = np.array((cos_gamma, sin_gamma, 0))
     v2 = np.array((cos_beta, (cos_alpha - cos_beta * cos_gamma) / sin_gamma, 0))
     v2[2] = np.sqrt(1 - (v2**2).sum())
-    Rbasis = torch.tensor(np.array([a * v0, b * v1, c * v2]).T)
+    Rbasis = np.stack((a * v0, b * v1, c * v2)).T
 
-    # Apply modifications if any:
-    if modification is None:
-        M = torch.eye(3)  # transformation from base lattice
-    else:
+    # Apply modifications if any (in numpy; convert to torch only at the end):
+    if modification is not None:
         assert isinstance(modification, str)
         modification = modification.lower()
-        if modification == "body-centered":
-            check_modification(["orthorhombic", "tetragonal", "cubic"])
-            M = 0.5 * torch.tensor([[-1, 1, 1], [1, -1, 1], [1, 1, -1]])
-        elif modification == "base-centered":
-            check_modification(["monoclinic"])
-            M = 0.5 * torch.tensor([[1, -1, 0], [1, 1, 0], [0, 0, 2]])
-        elif modification == "face-centered":
-            check_modification(["orthorhombic", "cubic"])
-            M = 0.5 * torch.tensor([[0, 1, 1], [1, 0, 1], [1, 1, 0]])
-        else:
+        if modification not in _MODIFICATIONS:
             raise KeyError("Unknown lattice modification: " + modification)
+        check_modification(_MODIFICATION_SYSTEMS[modification])
+        Rbasis = Rbasis @ _MODIFICATIONS[modification]
 
-    return Rbasis @ M
+    return torch.from_numpy(np.ascontiguousarray(Rbasis))
@@ -9,6 +9,7 @@ __all__ = (
     "dagger",
     "accum_norm_",
     "accum_prod_",
+    "batched_eigh",
     "ortho_matrix",
     "eighg",
     "spherical_harmonics",
@@ -24,6 +25,7 @@ from ._linalg import (
     dagger,
     accum_norm_,
     accum_prod_,
+    batched_eigh,
     ortho_matrix,
     eighg,
 )
@@ -16,6 +16,11 @@ class LabeledPositions(NamedTuple):
     pseudovectors: Optional[torch.Tensor] = None  #: pseudovector labels (Npv x N x 3)
 
 
+def _wrap_half_(x: torch.Tensor) -> torch.Tensor:
+    """Wrap `x` to [-0.5, 0.5) in-place, using a single temporary."""
+    return x.sub_(x.add(0.5).floor_())
+
+
 def get_space_group(
     lattice_sym: torch.Tensor,
     lattice: Lattice,
@@ -37,84 +42,114 @@ def get_space_group(
     positions0, scalars, vectors0, pseudovectors0 = labeled_positions
     device = positions0.device
     n_ions = len(positions0)
+    n_sym = lattice_sym.shape[0]
+
+    # Compute all translations for each position that map it back to a position,
+    # batched over all point-group operations at once:
+    # --- positions transform by rot, so transposed on right-multiply
+    positions = positions0 @ lattice_sym.transpose(-1, -2)  # n_sym x n_ions x 3
+    offsets = positions0[None, None] - positions[:, :, None]  # possible translations
+    _wrap_half_(offsets)
 
-    # Prepare masks and transformations:
+    # Select those that map to positions with compatible labels (all ops at once):
     scalar_mask = (scalars[:, :, None] - scalars[:, None, :]).norm(dim=0) < tolerance
+    mask = scalar_mask[None].expand(n_sym, n_ions, n_ions)
     if (vectors0 is not None) or (pseudovectors0 is not None):
         sym_vectors = (lattice.Rbasis @ lattice_sym) @ lattice.invRbasis
-        sym_pseudovectors = sym_vectors * torch.linalg.det(lattice_sym).view(-1, 1, 1)
-
-    rot_list = []
-    trans_list = []
-    position_map_list = []
-    for i_sym in range(lattice_sym.shape[0]):
+        # Determinants via scalar triple product (avoids LU factorization for 3x3):
+        det = (
+            torch.linalg.cross(lattice_sym[:, 0], lattice_sym[:, 1])
+            * lattice_sym[:, 2]
+        ).sum(dim=-1)
+        sym_pseudovectors = sym_vectors * det.view(-1, 1, 1)
+    if vectors0 is not None:
+        vectors = vectors0[None] @ sym_vectors[:, None].transpose(-1, -2)
+        err = (vectors0[None, :, None] - vectors[:, :, :, None]).norm(dim=(1, 4))
+        mask = torch.logical_and(err < tolerance, mask)
+    if pseudovectors0 is not None:
+        pseudovectors = vectors0[None] @ sym_pseudovectors[:, None].transpose(-1, -2)
+        err = (pseudovectors0[None, :, None] - pseudovectors[:, :, :, None]).norm(
+            dim=(1, 4)
+        )
+        mask = torch.logical_and(err < tolerance, mask)
+
+    # Preallocate outputs (each point-group operation contributes at most as
+    # many translations as the first position has valid offsets, i.e. n_ions):
+    max_ops = n_sym * n_ions
+    rot = torch.empty((max_ops, 3, 3), device=device, dtype=lattice_sym.dtype)
+    trans = torch.empty((max_ops, 3), device=device, dtype=positions0.dtype)
+    position_map = torch.empty((max_ops, n_ions), device=device, dtype=torch.long)
+    n_ops = 0
+    index_offset = n_ions * torch.arange(n_ions, device=device)
+    for i_sym in range(n_sym):
         rot_cur = lattice_sym[i_sym]
-
-        # Compute all translations for each position that map it back to a position:
-        # --- positions transform by rot, so transposed on right-multiply
-        positions = positions0 @ rot_cur.T  # rotated positions
-        offsets = positions0[None, ...] - positions[:, None, :]  # possible translations
-        offsets -= torch.floor(0.5 + offsets)  # wrap to [-0.5,0.5)
-
-        # Select those that map to position with compatible labels:
-        mask = scalar_mask
-        if vectors0 is not None:
-            vectors = vectors0 @ sym_vectors[i_sym].T
-            err = (vectors0[:, None] - vectors[:, :, None]).norm(dim=(0, 3))
-            mask = torch.logical_and(err < tolerance, mask)
-        if pseudovectors0 is not None:
-            pseudovectors = vectors0 @ sym_pseudovectors[i_sym].T
-            err = (pseudovectors0[:, None] - pseudovectors[:, :, None]).norm(dim=(0, 3))
-            mask = torch.logical_and(err < tolerance, mask)
-
-        # Find offsets that work for every position:
-        common_offsets = None
-        for i_ion in mask.count_nonzero(dim=1).argsort():
-            # in ascending order of number of valid offsets
-            offsets_cur = offsets[i_ion][mask[i_ion]]
-            if common_offsets is None:
-                common_offsets = offsets_cur
-            else:
-                # compute intersection of (common_offsets, offsets_cur)
-                doffset = common_offsets[:, None, :] - offsets_cur[None, ...]
-                doffset -= torch.floor(0.5 + doffset)  # wrap to [-0.5,0.5)
-                is_common = (doffset.norm(dim=-1) < tolerance).any(dim=1)
-                common_offsets = common_offsets[is_common]
-        if common_offsets is None:
+        offsets_sym = offsets[i_sym]
+        mask_sym = mask[i_sym]
+
+        # Find offsets that work for every position, starting from the position
+        # with fewest valid offsets (the intersection typically collapses to a
+        # handful of candidates immediately, so remaining order is irrelevant):
+        i_first = int(mask_sym.count_nonzero(dim=1).argmin().item())
+        common_offsets = offsets_sym[i_first][mask_sym[i_first]]
+        for i_ion in range(n_ions):
+            if not len(common_offsets):
+                break  # intersection already empty: no valid translation
+            if i_ion == i_first:
+                continue
+            # compute intersection of (common_offsets, offsets_cur)
+            offsets_cur = offsets_sym[i_ion][mask_sym[i_ion]]
+            doffset = common_offsets[:, None, :] - offsets_cur[None, ...]
+            _wrap_half_(doffset)
+            is_common = (doffset.norm(dim=-1) < tolerance).any(dim=1)
+            common_offsets = common_offsets[is_common]
+        if not len(common_offsets):
             continue
 
-        # Determine position map for each offset and optimize it:
-        index_offset = n_ions * torch.arange(n_ions, device=device)
-        for offset in common_offsets:
-            doffset = offsets - offset[None, None, :]
-            doffset -= torch.floor(0.5 + doffset)  # wrap to [-0.5,0.5)
-            position_map_cur = doffset.norm(dim=-1).argmin(dim=1)
-            # Optimize offset by accounting for all atoms:
-            doffset_best = doffset.view(-1, 3)[index_offset + position_map_cur]
-            offset_opt = offset + doffset_best.mean(axis=0)
-            # Add to space group:
-            rot_list.append(rot_cur)
-            trans_list.append(offset_opt)
-            position_map_list.append(position_map_cur)
-
-    rot = torch.stack(rot_list)
-    trans = torch.stack(trans_list)
-    position_map = torch.stack(position_map_list)
-    return rot, trans, position_map
+        # Determine position map for each offset and optimize it (all at once):
+        doffset = offsets_sym[None] - common_offsets[:, None, None, :]
+        _wrap_half_(doffset)  # n_offsets x n_ions x n_ions x 3
+        position_map_cur = doffset.norm(dim=-1).argmin(dim=2)  # n_offsets x n_ions
+        # Optimize offsets by accounting for all atoms:
+        flat_index = index_offset[None] + position_map_cur
+        doffset_best = torch.gather(
+            doffset.flatten(1, 2), 1, flat_index[..., None].expand(-1, -1, 3)
+        )  # n_offsets x n_ions x 3
+        offsets_opt = common_offsets + doffset_best.mean(dim=1)
+        # Add to space group:
+        n_ops_new = n_ops + len(common_offsets)
+        rot[n_ops:n_ops_new] = rot_cur
+        trans[n_ops:n_ops_new] = offsets_opt
+        position_map[n_ops:n_ops_new] = position_map_cur
+        n_ops = n_ops_new
+
+    return rot[:n_ops], trans[:n_ops], position_map[:n_ops]
+
+
+@torch.jit.script
+def _symmetrize_positions(
+    positions: torch.Tensor,
+    rot: torch.Tensor,
+    rot_inv: torch.Tensor,
+    trans: torch.Tensor,
+    position_map: torch.Tensor,
+) -> torch.Tensor:
+    """JIT-fused core of `symmetrize_positions`."""
+    pos_rot = positions @ rot.transpose(-2, -1) + trans[:, None]
+    # Correction on rotated positions:
+    dpos_rot = positions[position_map] - pos_rot
+    _wrap_half_(dpos_rot)
+    # Transform corrections back and average (using cached inverse rotations):
+    dpos = dpos_rot @ rot_inv.transpose(-2, -1)
+    return positions + dpos.mean(dim=0)
 
 
 def symmetrize_positions(
     self: symmetries.Symmetries, positions: torch.Tensor
 ) -> torch.Tensor:
     """Symmetrize `positions` (n_ions x 3)"""
-    pos_rot = positions @ self.rot.transpose(-2, -1) + self.trans[:, None]
-    pos_mapped = positions[self.position_map, :]
-    # Correction on rotated positions:
-    dpos_rot = pos_mapped - pos_rot
-    dpos_rot -= torch.floor(0.5 + dpos_rot)  # wrap to [-0.5,0.5)
-    # Transform corrections back and average:
-    dpos = dpos_rot @ torch.linalg.inv(self.rot.transpose(-2, -1))
-    return positions + dpos.mean(dim=0)
+    return _symmetrize_positions(
+        positions, self.rot, self.rot_inv, self.trans, self.position_map
+    )
 
 
 def symmetrize_forces(
@@ -22,6 +22,7 @@ class Symmetries(TreeNode):
     tolerance: float  #: Relative error threshold in detecting symmetries
     n_sym: int  #: Number of space group operations
     rot: torch.Tensor  #: Rotations in fractional coordinates (n_sym x 3 x 3)
+    rot_inv: torch.Tensor  #: Inverse rotations in fractional coordinates
     trans: torch.Tensor  #: Translations in fractional coordinates (n_sym x 3)
     position_map: torch.Tensor  #: Index each position maps to (n_sym x n_positions)
     i_id: int  #: Index of identity operation within space group
@@ -95,6 +96,7 @@ class Symmetries(TreeNode):
 
         # Set and enforce symmetries:
         self.rot = rot
+        self.rot_inv = torch.linalg.inv(rot)  # cached for repeated symmetrization
         self.trans = trans
         self.position_map = position_map
         self.n_sym = self.rot.shape[0]
@@ -128,7 +128,11 @@ class Geometry(TreeNode):
 
     @property
     def rho(self) -> TensorList:
-        """Get current values of density matrices."""
+        """Get current values of density matrices.
+        Note that per-patch storage is deliberate: sub-quad patches need not
+        share grid shapes, and material terms track state by patch identity,
+        so a single stacked (n_patches x ...) tensor is not viable. TensorList
+        batches arithmetic across the patches instead."""
         return TensorList(patch.rho for patch in self.patches)
 
     @rho.setter
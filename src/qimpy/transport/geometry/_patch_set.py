@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Optional
+from dataclasses import dataclass
 
 import torch
 
@@ -14,6 +15,10 @@ from . import TensorList, Geometry, Patch, parse_svg
 class PatchSet(Geometry):
     """Spatial transport starting from a SVG cubic spline specification."""
 
+    rho_padded: TensorList  #: persistent ghost-padded buffers for local patches
+    reflect_plan: list[tuple[int, int]]  #: local (patch, edge) pairs with reflectors
+    transfer_plan: list[EdgeTransfer]  #: pass-through ghost transfers involving me
+
     # v_F and N_theta should eventually be material paramteters
     def __init__(
         self,
@@ -64,6 +69,59 @@ class PatchSet(Geometry):
         for patch in self.patches:
             material.initialize_fields(patch.rho, field_params, id(patch))
 
+        # Persistent ghost-padded buffers, reused across time steps.
+        # Ghost zones never written in `apply_boundaries` (corners and
+        # unconnected edges) remain zero from this initialization:
+        self.rho_padded = TensorList(
+            torch.zeros(patch.rho_padded_shape, device=rc.device)
+            for patch in self.patches
+        )
+
+        # Precompute boundary-transfer plan (fixed for the geometry):
+        self.reflect_plan = []
+        self.transfer_plan = []
+        for i_patch, adjacency in enumerate(self.sub_quad_set.adjacency):
+            write_mine = self.patch_division.is_mine(i_patch)
+            i_patch_mine = (i_patch - self.patch_division.i_start) if write_mine else -1
+            if write_mine:
+                for i_edge, reflector in enumerate(
+                    self.patches[i_patch_mine].reflectors
+                ):
+                    if reflector is not None:
+                        self.reflect_plan.append((i_patch_mine, i_edge))
+            for i_edge, (other_patch, other_edge) in enumerate(adjacency):
+                if other_patch >= 0:
+                    read_mine = self.patch_division.is_mine(other_patch)
+                    if read_mine or write_mine:
+                        delta_edge = other_edge - i_edge
+                        self.transfer_plan.append(
+                            EdgeTransfer(
+                                i_patch_mine=i_patch_mine,
+                                i_edge=i_edge,
+                                read_mine=read_mine,
+                                write_mine=write_mine,
+                                tag=(4 * i_patch + i_edge),  # unique for each message
+                                other_patch_mine=(
+                                    (other_patch - self.patch_division.i_start)
+                                    if read_mine
+                                    else -1
+                                ),
+                                in_slice=IN_SLICES[other_edge],
+                                out_slice=OUT_SLICES[i_edge],
+                                swap=bool(delta_edge % 2),
+                                flip_dims=FLIP_DIMS[delta_edge],
+                                read_whose=self.patch_division.whose(other_patch),
+                                write_whose=self.patch_division.whose(i_patch),
+                                mask=(
+                                    self.patches[i_patch_mine].aperture_selections[
+                                        i_edge
+                                    ]
+                                    if write_mine
+                                    else None
+                                ),
+                            )
+                        )
+
     def rho_dot(self, rho: TensorList, t: float) -> TensorList:
         material = self.material
         rho_padded = self.apply_boundaries(rho, t)
@@ -76,80 +134,69 @@ class PatchSet(Geometry):
     def apply_boundaries(self, rho_list: TensorList, t: float) -> TensorList:
         """Apply all boundary conditions to `rho` at time `t` and produce
         ghost-padded version. The list contains the data for each patch."""
-        # Create padded version for all patches:
-        out_list = TensorList()
-        for patch, rho in zip(self.patches, rho_list):
-            out = torch.zeros(patch.rho_padded_shape, device=rc.device)
+        # Copy interiors into the persistent padded buffers for all patches:
+        out_list = self.rho_padded
+        for out, rho in zip(out_list, rho_list):
             out[Patch.NON_GHOST, Patch.NON_GHOST] = rho
-            out_list.append(out)
 
-        # Populate ghost zones across patches where needed:
+        # Reflections (always local):
+        for i_patch_mine, i_edge in self.reflect_plan:
+            patch = self.patches[i_patch_mine]
+            reflector = patch.reflectors[i_edge]
+            # Fetch the data in appropriate orientation:
+            ghost_data = rho_list[i_patch_mine][IN_SLICES[i_edge]]
+            if i_edge % 2 == 0:
+                ghost_data = ghost_data.swapaxes(0, 1)  # short axis first
+            # Reflect:
+            ghost_data = reflector(ghost_data)  # reciprocal space changes
+            ghost_data = ghost_data.flip(dims=(0,))  # flip short axis
+            # Apply contacts, if any:
+            for contact_slice, contactor in patch.contacts[i_edge]:
+                ghost_data[:, contact_slice] = contactor(t)
+            # Store back:
+            if i_edge % 2 == 0:
+                ghost_data = ghost_data.swapaxes(0, 1)  # restore axis order
+            out_list[i_patch_mine][OUT_SLICES[i_edge]] = ghost_data
+
+        # Pass-through boundaries (may involve MPI communication):
         requests = []
         pending_reads = []  # keep reference to data so that it doesn't deallocate
         pending_writes = []  # keep plans for writes till transfers complete
-        for i_patch, adjacency in enumerate(self.sub_quad_set.adjacency):
-            for i_edge, (other_patch, other_edge) in enumerate(adjacency):
-                # Reflections (always local):
-                if self.patch_division.is_mine(i_patch):
-                    i_patch_mine = i_patch - self.patch_division.i_start
-                    patch = self.patches[i_patch_mine]
-                    reflector = patch.reflectors[i_edge]
-                    if reflector is not None:
-                        # Fetch the data in appropriate orientation:
-                        ghost_data = rho_list[i_patch_mine][IN_SLICES[i_edge]]
-                        if i_edge % 2 == 0:
-                            ghost_data = ghost_data.swapaxes(0, 1)  # short axis first
-                        # Reflect:
-                        ghost_data = reflector(ghost_data)  # reciprocal space changes
-                        ghost_data = ghost_data.flip(dims=(0,))  # flip short axis
-                        # Apply contacts, if any:
-                        for contact_slice, contactor in patch.contacts[i_edge]:
-                            ghost_data[:, contact_slice] = contactor(t)
-                        # Store back:
-                        if i_edge % 2 == 0:
-                            ghost_data = ghost_data.swapaxes(0, 1)  # restore axis order
-                        out_list[i_patch_mine][OUT_SLICES[i_edge]] = ghost_data
-
-                # Pass-through boundaries (may involve MPI communication):
-                if other_patch >= 0:
-                    read_mine = self.patch_division.is_mine(other_patch)
-                    write_mine = self.patch_division.is_mine(i_patch)
-                    tag = 4 * i_patch + i_edge  # unique for each message
-                    if read_mine:
-                        rho = rho_list[other_patch - self.patch_division.i_start]
-                        ghost_data = rho[IN_SLICES[other_edge]]
-                        delta_edge = other_edge - i_edge
-                        if delta_edge % 2:
-                            ghost_data = ghost_data.swapaxes(0, 1)
-                        if flip_dims := FLIP_DIMS[delta_edge]:
-                            ghost_data = ghost_data.flip(dims=flip_dims)
-                        if not write_mine:
-                            write_whose = self.patch_division.whose(i_patch)
-                            ghost_data = ghost_data.contiguous()
-                            pending_reads.append(ghost_data)  # hold till transfers done
-                            requests.append(
-                                self.comm.Isend(
-                                    BufferView(ghost_data), write_whose, tag
-                                )
-                            )
-                    if write_mine:
-                        i_patch_mine = i_patch - self.patch_division.i_start
-                        mask = self.patches[i_patch_mine].aperture_selections[i_edge]
-                        if read_mine:
-                            set_ghost_zone(
-                                out_list[i_patch_mine], i_edge, ghost_data, mask
-                            )
-                        else:
-                            read_whose = self.patch_division.whose(other_patch)
-                            ghost_data = torch.empty_like(
-                                out_list[i_patch_mine][OUT_SLICES[i_edge]]
-                            )
-                            requests.append(
-                                self.comm.Irecv(BufferView(ghost_data), read_whose, tag)
-                            )
-                            pending_writes.append(
-                                [i_patch_mine, i_edge, ghost_data, mask]
-                            )
+        for transfer in self.transfer_plan:
+            if transfer.read_mine:
+                rho = rho_list[transfer.other_patch_mine]
+                ghost_data = rho[transfer.in_slice]
+                if transfer.swap:
+                    ghost_data = ghost_data.swapaxes(0, 1)
+                if transfer.flip_dims:
+                    ghost_data = ghost_data.flip(dims=transfer.flip_dims)
+                if not transfer.write_mine:
+                    ghost_data = ghost_data.contiguous()
+                    pending_reads.append(ghost_data)  # hold till transfers done
+                    requests.append(
+                        self.comm.Isend(
+                            BufferView(ghost_data), transfer.write_whose, transfer.tag
+                        )
+                    )
+            if transfer.write_mine:
+                i_patch_mine = transfer.i_patch_mine
+                i_edge = transfer.i_edge
+                if transfer.read_mine:
+                    set_ghost_zone(
+                        out_list[i_patch_mine], i_edge, ghost_data, transfer.mask
+                    )
+                else:
+                    ghost_data = torch.empty_like(
+                        out_list[i_patch_mine][transfer.out_slice]
+                    )
+                    requests.append(
+                        self.comm.Irecv(
+                            BufferView(ghost_data), transfer.read_whose, transfer.tag
+                        )
+                    )
+                    pending_writes.append(
+                        [i_patch_mine, i_edge, ghost_data, transfer.mask]
+                    )
 
         # Finish pending data transfers and writes:
         if requests:
@@ -177,6 +224,25 @@ OUT_SLICES = [
 FLIP_DIMS = [(0, 1), (0,), None, (1,)]  #: which dims to flip during edge transfer
 
 
+@dataclass
+class EdgeTransfer:
+    """Precomputed plan for one pass-through ghost-zone transfer."""
+
+    i_patch_mine: int  #: local index of destination patch (-1 if not write_mine)
+    i_edge: int  #: destination edge within destination patch
+    read_mine: bool  #: whether the source patch is on this process
+    write_mine: bool  #: whether the destination patch is on this process
+    tag: int  #: unique MPI message tag for this transfer
+    other_patch_mine: int  #: local index of source patch (-1 if not read_mine)
+    in_slice: tuple  #: slice of source data to read (from `IN_SLICES`)
+    out_slice: tuple  #: slice of padded data to write (from `OUT_SLICES`)
+    swap: bool  #: whether to swap axes during transfer
+    flip_dims: Optional[tuple]  #: which dims to flip during transfer, if any
+    read_whose: int  #: process owning the source patch
+    write_whose: int  #: process owning the destination patch
+    mask: Optional[torch.Tensor] = None  #: aperture mask at destination, if any
+
+
 def set_ghost_zone(
     data: torch.Tensor,
     i_edge: int,
@@ -13,6 +13,14 @@ from qimpy.io import InvalidInputException
 from . import spline_length, evaluate_spline, within_circles_np
 
 
+try:
+    import numba
+
+    NUMBA_AVAILABLE: bool = True  #: Whether numba is available (edge equivalence)
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
 QUAD_N_SIDES: int = 4  #: Support only quads (implicitly required throughout)
 
 
@@ -320,39 +328,75 @@ def get_displacements(
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Check consistency and collect displacements between adjacent edges.
     Also return ij_quad and ij_edge pairs for eaqch displacement (each Npairs x 2)."""
-    i_quad, i_edge = np.where(adjacency[..., 0] >= 0)
-    j_quad, j_edge = adjacency[i_quad, i_edge].T
+    edge_mask = adjacency[..., 0] >= 0  # connected edges (single mask, reused below)
+    i_quad, i_edge = np.nonzero(edge_mask)
+    j_quad, j_edge = adjacency[edge_mask].T
     verts_i = vertices[quads[i_quad, i_edge]]
     verts_j = vertices[quads[j_quad, j_edge]][:, ::-1]
     deltas = verts_i - verts_j
     assert np.all(deltas.std(axis=1) < tol).item()
     displacements = np.zeros(adjacency.shape)
-    displacements[i_quad, i_edge] = deltas.mean(axis=1)
+    displacements[edge_mask] = deltas.mean(axis=1)
     return displacements, np.stack((i_quad, j_quad)).T, np.stack((i_edge, j_edge)).T
 
 
 def equivalence_classes(pairs: np.ndarray, N: int) -> np.ndarray:
     """Given Npair x 2 array of index pairs (into a sequence of length N) that
     are equivalent, compute equivalence class numbers for each original index."""
-    # Construct adjacency matrix:
-    i_pair, j_pair = pairs.T
-    adjacency_matrix = np.eye(N)
-    adjacency_matrix[i_pair, j_pair] = 1.0
-    adjacency_matrix[j_pair, i_pair] = 1.0
-
-    # Expand to indirect neighbors by repeated multiplication:
-    n_non_zero_prev = np.count_nonzero(adjacency_matrix)
-    for i_mult in range(N):
-        adjacency_matrix = adjacency_matrix @ adjacency_matrix
-        n_non_zero = np.count_nonzero(adjacency_matrix)
-        if n_non_zero == n_non_zero_prev:
-            break  # highest-degree connection reached
-        n_non_zero_prev = n_non_zero
-
-    # Find first non-zero entry of above (i.e. first equivalent index):
-    is_first = np.logical_and(
-        adjacency_matrix.cumsum(axis=1) == adjacency_matrix, adjacency_matrix != 0.0
-    )
-    first_index = np.where(is_first)[1]
-    assert len(first_index) == N
-    return np.unique(first_index, return_inverse=True)[1]  # minimal class indices
+    roots = _union_find_roots(pairs.reshape(-1, 2).astype(np.int64), N)
+    return np.unique(roots, return_inverse=True)[1]  # minimal class indices
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True)
+    def _union_find_roots(pairs, N):  # type: ignore
+        """Union-find over the pair list (linear in N and pairs, instead of
+        the O(N^3) transitive closure by repeated adjacency-matrix squaring;
+        with only a handful of neighbors per patch, even a sparse-matmul
+        closure would waste work compared to this). Unions keep the smallest
+        index as root."""
+        parent = np.arange(N)
+        for i_pair in range(pairs.shape[0]):
+            root_i = pairs[i_pair, 0]
+            root_j = pairs[i_pair, 1]
+            while parent[root_i] != root_i:
+                parent[root_i] = parent[parent[root_i]]  # path compression
+                root_i = parent[root_i]
+            while parent[root_j] != root_j:
+                parent[root_j] = parent[parent[root_j]]
+                root_j = parent[root_j]
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        roots = np.empty(N, dtype=np.int64)
+        for i in range(N):
+            root = i
+            while parent[root] != root:
+                parent[root] = parent[parent[root]]
+                root = parent[root]
+            roots[i] = root
+        return roots
+
+else:
+
+    def _union_find_roots(pairs: np.ndarray, N: int) -> np.ndarray:
+        """Union-find over the pair list (linear in N and pairs, instead of
+        the O(N^3) transitive closure by repeated adjacency-matrix squaring;
+        with only a handful of neighbors per patch, even a sparse-matmul
+        closure would waste work compared to this). Unions keep the smallest
+        index as root."""
+        parent = list(range(N))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]  # path compression
+                i = parent[i]
+            return i
+
+        for i, j in pairs.tolist():
+            root_i = find(i)
+            root_j = find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        return np.array([find(i) for i in range(N)])
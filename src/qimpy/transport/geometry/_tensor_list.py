@@ -3,11 +3,15 @@ import torch
 
 
 class TensorList(list[torch.Tensor]):
+    """List of per-patch tensors with arithmetic batched across patches.
+    The `torch._foreach_` variants apply each operation to all patches in
+    grouped kernel launches, instead of one launch per patch."""
+
     def __mul__(self, scale: float) -> TensorList:
-        return TensorList(scale * ti for ti in self)
+        return TensorList(torch._foreach_mul(self, scale) if self else [])
 
     def __rmul__(self, scale: float) -> TensorList:
         return self * scale
 
     def __add__(self, other: TensorList) -> TensorList:
-        return TensorList(ti + tj for ti, tj in zip(self, other))
+        return TensorList(torch._foreach_add(self, other) if self else [])
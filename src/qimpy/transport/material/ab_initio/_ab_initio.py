@@ -122,8 +122,11 @@ class AbInitio(Material):
                 process_grid=process_grid,
             )
 
-            self.k[:] = self.read_scalars(data_file, "k")
-            self.E[:] = self.read_scalars(data_file, "E")
+            # Rebind directly to the loaded data: the zero placeholders from
+            # Material.__init__ are dropped here (as for v and rho0 below),
+            # rather than allocated, copied into and kept alive:
+            self.k = self.read_scalars(data_file, "k")
+            self.E = self.read_scalars(data_file, "E")
             self.P = self.read_vectors(data_file, "P")
             self.S = self.read_vectors(data_file, "S") if spinorial else None
             self.L = self.read_vectors(data_file, "L") if useL else None